@@ -1,214 +1,361 @@
 import os
+import re
 import json
-from dataclasses import dataclass
+import sqlite3
+from contextlib import closing
+from bisect import bisect_left, insort
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace as custom_replace
 from typing import List, Dict
 from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
 import tkinter as tk
 import tkinter.messagebox as messagebox
 from typing import Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the json module
+    orjson = None
+
+# Sort keys built once and shared by every sort
+SORT_KEYS = {
+    "Priority": attrgetter("priority"),
+    "Due Date": attrgetter("due_date")
+}
+
 def my_sorted(iterable, key=None):
-    def bubble_sort(arr, n, i=0):
-        if n == 1:
-            return arr
-        if i == n - 1:
-            return bubble_sort(arr, n - 1)  # Reduce the problem size
-        # Swap if needed
-        if (key(arr[i]) if key else arr[i]) > (key(arr[i + 1]) if key else arr[i + 1]):
-            arr[i], arr[i + 1] = arr[i + 1], arr[i]
-
-        # Recurse to the next element
-        return bubble_sort(arr, n, i + 1)
-    return bubble_sort(iterable[:], len(iterable))  # Start sorting with a copy of the original list
-
-def custom_replace(obj, **kwargs):
-    class_name = type(obj)
-    updated_object = class_name(**{
-        key: kwargs.get(key, getattr(obj, key))
-        for key in obj.__dict__
-    })
-
-    return updated_object
-
-
-@dataclass
+    # sorted() returns a new list, so the original is left untouched
+    return sorted(iterable, key=key)
+
+def row_edits(old_rows: List[str], new_rows: List[str]) -> List[Tuple[str, int, any]]:
+    # Listbox calls that turn old_rows into new_rows: ("delete", first, last) and ("insert", index, rows)
+    # Skip the rows that are unchanged at the start and end of the list
+    start = 0
+    shortest = min(len(old_rows), len(new_rows))
+    while start < shortest and old_rows[start] == new_rows[start]:
+        start += 1
+
+    old_end, new_end = len(old_rows), len(new_rows)
+    while old_end > start and new_end > start and old_rows[old_end - 1] == new_rows[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    # Replace only the changed block, with at most one delete and one insert
+    edits = []
+    if old_end > start:
+        edits.append(("delete", start, old_end - 1))
+    if new_end > start:
+        edits.append(("insert", start, new_rows[start:new_end]))
+    return edits
+
+def parse_due_date(value: str) -> datetime:
+    # fromisoformat reads the stored "YYYY-MM-DD HH:MM:SS" layout much faster than strptime
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+def parse_entry_date(value: str) -> datetime:
+    # The date boxes only accept YYYY-MM-DD, so split it instead of going through strptime.
+    # int() would also take spaces, signs and short fields, so check the layout first.
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value, re.ASCII):
+        year, month, day = value.split("-")
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    raise ValueError(f"time data {value!r} does not match format 'YYYY-MM-DD'")
+
+
+@dataclass(slots=True, frozen=True)
 class Task:
     task_id: str
     description: str
     due_date: datetime
     priority: int
     status: str = "Pending"
+    # Listbox text, built once per task since tasks never change after creation
+    display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "display",
+            f"{self.task_id} - {self.description} (Due: {self.due_date:%Y-%m-%d}, Priority: {self.priority}, Status: {self.status})"
+        )
 
 
 class TaskManager:
-    TASKS_FILE = "D:/year 4 term 1/concept/project/functional_programming/tasks.json"
-
-    def add_task(tasks: List[Task], description: str, due_date: datetime, priority: int) -> Tuple[List[Task], Task]:
-        new_task = Task(f"T{len(tasks) + 1}", description, due_date, priority)
+    # Stored next to this script unless the TASKS_FILE environment variable points elsewhere
+    TASKS_FILE = os.environ.get("TASKS_FILE") or str(Path(__file__).with_name("tasks.json"))
+    STATUSES = ("Pending", "Completed", "Overdue")
+    # A TASKS_FILE with one of these suffixes is stored in SQLite instead of JSON
+    SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+    # Last loaded or saved tasks, reused while the file's version is unchanged
+    task_cache = {"path": None, "version": None, "tasks": []}
+
+    @staticmethod
+    def add_task(tasks: List[Task], description: str, due_date: datetime, priority: int, task_number: int = None) -> Tuple[List[Task], Task]:
+        # Callers that track the counter pass the number, otherwise continue after the highest id
+        if task_number is None:
+            task_number = TaskManager.last_task_number(tasks) + 1
+        new_task = Task(f"T{task_number}", description, due_date, priority)
         # Create a new list with the added task
         return tasks + [new_task], new_task
 
-    def update_task(tasks: List[Task], task_id: str, updates: Dict[str, any], replace_function) -> Tuple[List[Task], Task]:
-        
-        def update_recursively(tasks, task_id, updates, index=0, updated_task=None):
-            # Base case
-            if not tasks:
-                return tasks, updated_task
-
-            # Check if the current task matches the task_id
-            current_task = tasks[0]
-            if current_task.task_id == task_id:
-                # Apply the updates if task_id matches
-                updated_task = replace_function(
-                    current_task,
-                    description=updates.get("description", current_task.description),
-                    due_date=updates.get("due_date", current_task.due_date),
-                    priority=updates.get("priority", current_task.priority),
-                    status=updates.get("status", current_task.status)
-                )
-                # Update the task in the list
-                return [updated_task] + tasks[1:], updated_task
-            
-            # Recurse on the rest of the list
-            updated_tasks, updated_task = update_recursively(tasks[1:], task_id, updates, index + 1, updated_task)
-            # Rebuild the list by adding the updated first task back in
-            return [tasks[0]] + updated_tasks, updated_task
+    @staticmethod
+    def last_task_number(tasks: List[Task]) -> int:
+        # Ids are never reused, so new ones continue after the highest existing number.
+        # Ids edited by hand into another shape cannot clash with generated ones, so they are skipped.
+        matches = (re.fullmatch(r"T(\d+)", str(task.task_id), re.ASCII) for task in tasks)
+        return max((int(match[1]) for match in matches if match), default=0)
+
+    @staticmethod
+    def update_task(tasks: List[Task], task_id: str, updates: Dict[str, any], replace_function, task_index: Dict[str, int] = None) -> Tuple[List[Task], Task]:
+        # Work on a copy so the caller's list is left untouched
+        updated_tasks = list(tasks)
+
+        # Use the id index when given, otherwise scan for the task
+        if task_index is not None:
+            index = task_index.get(task_id)
+        else:
+            index = next((i for i, task in enumerate(tasks) if task.task_id == task_id), None)
+
+        if index is None:
+            return updated_tasks, None
+
+        # Apply the updates to the matching task
+        current_task = updated_tasks[index]
+        updated_task = replace_function(
+            current_task,
+            description=updates.get("description", current_task.description),
+            due_date=updates.get("due_date", current_task.due_date),
+            priority=updates.get("priority", current_task.priority),
+            status=updates.get("status", current_task.status)
+        )
+        updated_tasks[index] = updated_task
 
-        # Start the recursion
-        updated_tasks, updated_task = update_recursively(tasks, task_id, updates)
-        
         #TaskManager.save_tasks(updated_tasks)
         return updated_tasks, updated_task
 
-    def delete_task(tasks: List[Task], task_id: str) -> List[Task]: # removed renumber and save
-        
-        def delete_recursively(tasks, task_id, result=[]):
-            # Base case
-            if not tasks:
-                return result
-
-            # Get the first task
-            task = tasks[0]
+    @staticmethod
+    def delete_task(tasks: List[Task], task_id: str, task_index: Dict[str, int] = None) -> List[Task]: # removed renumber and save
+        if task_index is not None:
+            index = task_index.get(task_id)
+            if index is None:
+                return list(tasks)
+            # Cut the task out by position instead of comparing every id
+            return tasks[:index] + tasks[index + 1:]
 
-            # If task_id doesn't match, keep the task in the result
-            if task.task_id != task_id:
-                return [task] + delete_recursively(tasks[1:], task_id)
-
-            # Recurse with the remaining tasks
-            return delete_recursively(tasks[1:], task_id)
-
-        # Start the recursion with the full list of tasks
-        return delete_recursively(tasks, task_id)
+        # Keep every task whose id doesn't match
+        return [task for task in tasks if task.task_id != task_id]
 
+    @staticmethod
     def filter_tasks(tasks: List[Task], filter_by: str) -> List[Task]:
-        
-        def filter_recursively(tasks, filter_by):
-            # Base case
-            if not tasks:
-                return []
+        # Return all tasks if the filter is not a known status
+        if filter_by not in TaskManager.STATUSES:
+            return list(tasks)
 
-            # Get the first task
-            task = tasks[0]
+        return [task for task in tasks if task.status == filter_by]
 
-            # Apply the filter criteria
-            filtered_tasks = filter_recursively(tasks[1:], filter_by)
-            
-            match filter_by:
-                case "Pending":
-                    return [task] + filtered_tasks if task.status == "Pending" else filtered_tasks
-                case "Completed":
-                    return [task] + filtered_tasks if task.status == "Completed" else filtered_tasks
-                case "Overdue":
-                    return [task] + filtered_tasks if task.status == "Overdue" else filtered_tasks
-                case _:
-                    return [task] + filtered_tasks  # Return all tasks if no match
-
-        # Start the recursion with the full list of tasks
-        return filter_recursively(tasks, filter_by)
+    @staticmethod
+    def group_by_status(tasks: List[Task]) -> Dict[str, List[Task]]:
+        # One pass splits the tasks by status, keeping their order within each group
+        groups = defaultdict(list)
+        for task in tasks:
+            groups[task.status].append(task)
+        return groups
 
+    @staticmethod
     def sort_tasks(tasks: List[Task], sort_function, sort_by: str) -> List[Task]:
-        match sort_by:
-            case "Priority":
-                return sort_function(tasks, key=lambda task: task.priority)
-            case "Due Date":
-                return sort_function(tasks, key=lambda task: task.due_date)
-            case _:
-                return tasks
+        # Look the key up once instead of matching on sort_by
+        key = SORT_KEYS.get(sort_by)
+        if key is None:
+            return tasks
+
+        return sort_function(tasks, key=key)
 
+    @staticmethod
     def load_tasks() -> List[Task]: #convert to list of tasks
         try:
             if not os.path.exists(TaskManager.TASKS_FILE):
                 return []
 
-            with open(TaskManager.TASKS_FILE, 'r') as f:
-                task_dicts = json.load(f)
-                
-                def create_task_from_dict(task_dicts, tasks=[]):
-                    # Base case
-                    if not task_dicts:
-                        return tasks
-                    
-                    # Process the first task_dict and create a Task
-                    task_dict = task_dicts[0]
-                    task = Task(
-                        task_id=task_dict["task_id"],
-                        description=task_dict["description"],
-                        due_date=datetime.strptime(task_dict["due_date"], "%Y-%m-%d %H:%M:%S"),
-                        priority=task_dict["priority"],
-                        status=task_dict["status"]
-                    )
-                    
-                    # Recurse on the remaining task_dicts
-                    return create_task_from_dict(task_dicts[1:], tasks + [task])
+            # Skip reading and parsing if the file hasn't changed since we last saw it
+            version = TaskManager.file_version()
+            cache = TaskManager.task_cache
+            if cache["path"] == TaskManager.TASKS_FILE and cache["version"] == version:
+                return list(cache["tasks"])
 
-                # Start recursion with the list of task_dicts
-                return create_task_from_dict(task_dicts)
+            if TaskManager.uses_sqlite():
+                task_dicts = TaskManager.read_sqlite()
+            else:
+                task_dicts = TaskManager.read_json()
+
+            tasks = [
+                Task(
+                    task_id=task_dict["task_id"],
+                    description=task_dict["description"],
+                    due_date=parse_due_date(task_dict["due_date"]),
+                    priority=task_dict["priority"],
+                    status=task_dict["status"]
+                )
+                for task_dict in task_dicts
+            ]
+            TaskManager.remember_tasks(tasks, version)
+            return list(tasks)
 
-        except (json.JSONDecodeError, KeyError, FileNotFoundError):
+        except (json.JSONDecodeError, KeyError, FileNotFoundError, sqlite3.Error):
             return []
 
+    @staticmethod
     def save_tasks(tasks: List[Task]) -> None:
-        
-        def build_task_dicts(tasks, task_dicts=[]):
-            # Base case
-            if not tasks:
-                return task_dicts
-
-            # Extract the first task and create the corresponding dictionary
-            task = tasks[0]
-            task_dict = {
-                "task_id": task.task_id,
-                "description": task.description,
-                "due_date": task.due_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "priority": task.priority,
-                "status": task.status
-            }
-
-            # Recurse on the remaining tasks
-            return build_task_dicts(tasks[1:], task_dicts + [task_dict])
-
-        # Start the recursion
-        task_dicts = build_task_dicts(tasks)
-        
-        # Write to the file
-        with open(TaskManager.TASKS_FILE, 'w') as f:
-            json.dump(task_dicts, f, indent=2)
+        if TaskManager.uses_sqlite():
+            TaskManager.write_sqlite(tasks)
+        else:
+            TaskManager.write_json(tasks)
+
+        # What we just wrote is the file's content, so the next load can reuse it
+        TaskManager.remember_tasks(list(tasks), TaskManager.file_version())
+
+    @staticmethod
+    def task_to_dict(task: Task) -> Dict[str, any]:
+        # Called by the serializers one task at a time, so all the dicts never exist at once
+        return {
+            "task_id": task.task_id,
+            "description": task.description,
+            "due_date": task.due_date.isoformat(sep=" ", timespec="seconds"),
+            "priority": task.priority,
+            "status": task.status
+        }
+
+    @staticmethod
+    def file_version():
+        # SQLite in WAL mode commits into the -wal file and leaves the main file's mtime alone,
+        # so a non-empty log counts towards the version too
+        version = os.stat(TaskManager.TASKS_FILE).st_mtime_ns
+        if not TaskManager.uses_sqlite():
+            return version
+
+        try:
+            wal = os.stat(TaskManager.TASKS_FILE + "-wal")
+        except FileNotFoundError:
+            return version, None
+        return (version, (wal.st_mtime_ns, wal.st_size)) if wal.st_size else (version, None)
+
+    @staticmethod
+    def uses_sqlite() -> bool:
+        return TaskManager.TASKS_FILE.endswith(TaskManager.SQLITE_SUFFIXES)
+
+    @staticmethod
+    def read_json() -> List[Dict[str, any]]:
+        with open(TaskManager.TASKS_FILE, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson else json.loads(data)
+
+    @staticmethod
+    def write_json(tasks: List[Task]) -> None:
+        if orjson:
+            # Passthrough makes orjson hand each Task to task_to_dict instead of dumping every field
+            data = orjson.dumps(
+                tasks,
+                default=TaskManager.task_to_dict,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        else:
+            data = json.dumps(tasks, default=TaskManager.task_to_dict, indent=2).encode()
+
+        # Write to a temporary file and swap it in, so a crash never leaves a truncated file
+        temp_file = TaskManager.TASKS_FILE + ".tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, TaskManager.TASKS_FILE)
+
+    @staticmethod
+    def read_sqlite() -> List[Dict[str, any]]:
+        with closing(sqlite3.connect(TaskManager.TASKS_FILE)) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("SELECT task_id, description, due_date, priority, status FROM tasks ORDER BY rowid")
+            return [dict(row) for row in rows]
+
+    @staticmethod
+    def write_sqlite(tasks: List[Task]) -> None:
+        with closing(sqlite3.connect(TaskManager.TASKS_FILE)) as conn:
+            # WAL commits append to a log instead of rewriting pages; it is folded back in when the last connection closes
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # One transaction, so readers see either the old tasks or the new ones
+            with conn:
+                # Take the write lock first, so no other writer can commit between the check below and our write
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS tasks ("
+                    "task_id TEXT PRIMARY KEY, description TEXT, due_date TEXT, priority INTEGER, status TEXT)"
+                )
+
+                saved = TaskManager.saved_tasks(tasks)
+                if saved is None:
+                    conn.execute("DELETE FROM tasks")
+                    changed = tasks
+                else:
+                    current_ids = {task.task_id for task in tasks}
+                    conn.executemany(
+                        "DELETE FROM tasks WHERE task_id = ?",
+                        [(task_id,) for task_id in saved.keys() - current_ids]
+                    )
+                    changed = [task for task in tasks if saved.get(task.task_id) != task]
+
+                # Updated rows keep their rowid and new ones go last, so the stored order matches the list
+                conn.executemany(
+                    "INSERT INTO tasks VALUES (:task_id, :description, :due_date, :priority, :status) "
+                    "ON CONFLICT(task_id) DO UPDATE SET description = excluded.description, "
+                    "due_date = excluded.due_date, priority = excluded.priority, status = excluded.status",
+                    map(TaskManager.task_to_dict, changed)
+                )
+
+    @staticmethod
+    def saved_tasks(tasks: List[Task]) -> Dict[str, Task]:
+        # The cached tasks by id if they still match the database and tasks can be written as a diff of them, else None
+        cache = TaskManager.task_cache
+        if cache["path"] != TaskManager.TASKS_FILE or cache["version"] != TaskManager.file_version():
+            return None
+
+        # Rows come back in rowid order, so a diff only works if kept tasks keep their order and new ones go last
+        saved = {task.task_id: task for task in cache["tasks"]}
+        task_ids = [task.task_id for task in tasks]
+        current_ids = set(task_ids)
+        kept = [task_id for task_id in saved if task_id in current_ids]
+        if task_ids[:len(kept)] != kept:
+            return None
+        return saved
+
+    @staticmethod
+    def remember_tasks(tasks: List[Task], version) -> None:
+        TaskManager.task_cache.update(path=TaskManager.TASKS_FILE, version=version, tasks=tasks)
+
+    @staticmethod
+    def validate_task(priority: int, due_date: datetime, now: datetime = None) -> Tuple[bool, str]:
+        # Batch callers can pass one shared "now" instead of reading the clock per task
+        now = now or datetime.now()
 
-    def validate_task(priority: int, due_date: datetime) -> Tuple[bool, str]:
         if priority < 1 or priority > 10:
             return False, "Priority must be between 1 and 10!"
         
-        if due_date <= datetime.now():
+        if due_date <= now:
             return False, "Due date must be in the future!"
         
         return True, "Task is valid"
 
-    def renumber_tasks(tasks: List[Task], replace_function, index: int = 0) -> None:
-        if index == len(tasks):  # Base case
-            return tasks
-        task = replace_function(tasks[index], task_id=f"T{index + 1}")
-        tasks[index] = task  # Update the task in the list
-        TaskManager.renumber_tasks(tasks, custom_replace, index + 1)  # Recursively renumber the next task
+    @staticmethod
+    def index_tasks(tasks: List[Task]) -> Dict[str, int]:
+        # Map each task_id to its position for constant-time lookups
+        return {task.task_id: index for index, task in enumerate(tasks)}
 
 
 class TaskPlannerGUI:
@@ -217,8 +364,30 @@ class TaskPlannerGUI:
         self.root = tk.Tk()
         self.root.title("Functional Task Planner")
         
-        # Tasks storage
-        self.tasks = TaskManager.load_tasks()
+        # Tasks storage: all_tasks is the full list, tasks is the sorted/filtered view
+        self.all_tasks = TaskManager.load_tasks()
+        self.task_index = TaskManager.index_tasks(self.all_tasks)
+        self.tasks = list(self.all_tasks)
+
+        # Counter for new task ids, so adding doesn't rescan every existing id
+        self.last_task_number = TaskManager.last_task_number(self.all_tasks)
+
+        # Current dropdown choices and sorted copies of all_tasks, reused until the next edit
+        self.sort_by = "All"
+        self.filter_by = "All"
+        self.sorted_views = {}
+        # Tasks of each sorted view grouped by status, so a filter is a dict lookup
+        self.status_groups = {}
+
+        # Pending writes are batched and flushed after a short delay
+        self.unsaved_changes = False
+        self.save_scheduled = False
+        # Writes run on one background thread so the window never waits on the disk
+        self.save_executor = ThreadPoolExecutor(max_workers=1)
+        self.save_future = None
+        # Pending dropdown callbacks, so only the last pick in a quick burst is applied
+        self.pending_choices = {}
+        self.root.protocol("WM_DELETE_WINDOW", self.close_handler)
         
         # Setup UI components
         self.setup_ui()
@@ -246,6 +415,7 @@ class TaskPlannerGUI:
 
     def create_task_list(self):
         self.task_listbox = tk.Listbox(self.root, width=50)
+        self.rendered_rows = []
         self.task_listbox.grid(row=0, column=0, padx=10, pady=10, rowspan=6)
 
     def create_control_buttons(self):
@@ -277,7 +447,7 @@ class TaskPlannerGUI:
             self.root,
             sort_var,
             *sort_options,
-            command=lambda selection: self.apply_sort(selection)
+            command=lambda selection: self.debounce_choice(self.apply_sort, selection)
         )
         sort_dropdown.grid(row=6, column=1, padx=10, pady=10)
 
@@ -288,44 +458,163 @@ class TaskPlannerGUI:
             self.root,
             filter_var,
             *filter_options,
-            command=lambda selection: self.apply_filter(selection)
+            command=lambda selection: self.debounce_choice(self.apply_filter, selection)
         )
         filter_dropdown.grid(row=7, column=1, padx=10, pady=10)
 
+    def debounce_choice(self, apply, selection):
+        """Apply a dropdown choice once the user has stopped changing it for 100 ms."""
+        pending = self.pending_choices.pop(apply, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self.pending_choices[apply] = self.root.after(100, self.run_choice, apply, selection)
+
+    def run_choice(self, apply, selection):
+        """Run a debounced dropdown choice."""
+        del self.pending_choices[apply]
+        apply(selection)
+
     def apply_sort(self, sort_by: str):
         """Apply sorting to tasks based on user selection."""
-        if sort_by == "All":  # Default or no sorting
-            self.tasks = TaskManager.load_tasks()
-        else:
-            self.tasks = TaskManager.sort_tasks(self.tasks, my_sorted, sort_by)
+        self.sort_by = sort_by
+        self.tasks = self.current_view()
         self.refresh_task_list()
 
     def apply_filter(self, filter_by: str):
         """Apply filtering to tasks based on user selection."""
-        if filter_by == "All":  # Default or no filtering
-            self.tasks = TaskManager.load_tasks()
-        else:
-            self.tasks = TaskManager.filter_tasks(TaskManager.load_tasks(), filter_by)
+        self.filter_by = filter_by
+        self.tasks = self.current_view()
         self.refresh_task_list()
 
+    def sorted_view(self, sort_by: str) -> List[Task]:
+        """Return all tasks sorted by sort_by, sorting only once per edit."""
+        if sort_by not in SORT_KEYS:  # Default or no sorting
+            return self.all_tasks
+
+        if sort_by not in self.sorted_views:
+            self.sorted_views[sort_by] = TaskManager.sort_tasks(self.all_tasks, my_sorted, sort_by)
+        return self.sorted_views[sort_by]
+
+    def update_sorted_views(self, added: Task = None, removed: Task = None):
+        """Keep the cached sorted views in order after a single add or delete."""
+        for sort_by, view in self.sorted_views.items():
+            key = SORT_KEYS[sort_by]
+            if removed is not None:
+                # Jump to the first task with the same key, then find the exact one
+                index = bisect_left(view, key(removed), key=key)
+                while view[index] is not removed:
+                    index += 1
+                del view[index]
+            if added is not None:
+                # New tasks come last in all_tasks, so they go after equal keys like a stable sort
+                insort(view, added, key=key)
+
+    def current_view(self) -> List[Task]:
+        """Build the displayed tasks from the selected sort and filter."""
+        if self.filter_by not in TaskManager.STATUSES:  # Default or no filtering
+            return list(self.sorted_view(self.sort_by))
+
+        if self.sort_by not in self.status_groups:
+            self.status_groups[self.sort_by] = TaskManager.group_by_status(self.sorted_view(self.sort_by))
+        return list(self.status_groups[self.sort_by].get(self.filter_by, []))
+
+    def schedule_save(self):
+        """Mark tasks as changed and write them once the burst of edits settles."""
+        self.unsaved_changes = True
+        if not self.save_scheduled:
+            self.save_scheduled = True
+            self.root.after(500, self.save_if_dirty)
+
+    def save_if_dirty(self):
+        """Write pending changes to the tasks file on the background thread."""
+        self.save_scheduled = False
+        if not self.unsaved_changes:
+            return
+
+        if self.save_future is not None and not self.save_future.done():
+            # One write at a time, so try again once the current one finishes
+            self.save_scheduled = True
+            self.root.after(100, self.save_if_dirty)
+            return
+
+        # Tasks are immutable, so a copy of the list is a safe snapshot for the worker
+        future = self.save_executor.submit(TaskManager.save_tasks, list(self.all_tasks))
+        self.save_future = future
+        self.unsaved_changes = False
+        self.root.after(100, self.check_save, future)
+
+    def check_save(self, future):
+        """Report a failed background write once it finishes."""
+        if not future.done():
+            self.root.after(100, self.check_save, future)
+            return
+
+        error = future.exception()
+        if error:
+            # Keep the changes pending so the next edit or closing retries the write
+            self.unsaved_changes = True
+            messagebox.showerror("Error", f"Could not save tasks: {error}")
+
+    def close_handler(self):
+        """Flush pending changes, closing the window only once they are written."""
+        # Wait for a write still in flight; if it failed, its changes are pending again
+        if self.save_future is not None and self.save_future.exception() is not None:
+            self.unsaved_changes = True
+
+        if self.unsaved_changes:
+            self.save_future = self.save_executor.submit(TaskManager.save_tasks, list(self.all_tasks))
+            error = self.save_future.exception()
+            if error:
+                # Stay open so the changes are not lost
+                messagebox.showerror("Error", f"Could not save tasks: {error}")
+                return
+            self.unsaved_changes = False
+
+        self.save_executor.shutdown(wait=True)
+        self.root.destroy()
+
+    def set_tasks(self, tasks: List[Task], added: Task = None, removed: Task = None):
+        """Replace the full task list after an edit and rebuild the view from it."""
+        self.all_tasks = tasks
+
+        # Keep the id index in step with the edit instead of rebuilding it.
+        # Updates replace tasks in place, so their positions do not move.
+        if added is not None:
+            self.task_index[added.task_id] = len(tasks) - 1
+        if removed is not None:
+            position = self.task_index.pop(removed.task_id)
+            for index in range(position, len(tasks)):
+                self.task_index[tasks[index].task_id] = index
+
+        if added is None and removed is None:
+            self.sorted_views = {}
+        else:
+            self.update_sorted_views(added, removed)
+        self.status_groups = {}
+
+        self.tasks = self.current_view()
+        self.schedule_save()
+
     def refresh_task_list(self):
-        self.task_listbox.delete(0, tk.END)
-        for task in self.tasks:
-            self.task_listbox.insert(
-                tk.END, 
-                f"{task.task_id} - {task.description} (Due: {task.due_date.strftime('%Y-%m-%d')}, Priority: {task.priority}, Status: {task.status})"
-            )
+        rows = [task.display for task in self.tasks]
+        for operation, index, argument in row_edits(self.rendered_rows, rows):
+            if operation == "delete":
+                self.task_listbox.delete(index, argument)
+            else:
+                self.task_listbox.insert(index, *argument)
+        self.rendered_rows = rows
 
     def add_task_handler(self):
         try:
             description = self.entries['description'].get()
-            due_date = datetime.strptime(self.entries['due_date'].get(), "%Y-%m-%d")
+            due_date = parse_entry_date(self.entries['due_date'].get())
             priority = int(self.entries['priority'].get())
             
-            if(TaskManager.validate_task(priority, due_date)[0]):
-                self.tasks, new_task = TaskManager.add_task(self.tasks, description, due_date, priority)
-                TaskManager.save_tasks(self.tasks)
-                TaskManager.renumber_tasks(self.tasks, custom_replace)
+            is_valid, message = TaskManager.validate_task(priority, due_date)
+            if is_valid:
+                self.last_task_number += 1
+                all_tasks, new_task = TaskManager.add_task(self.all_tasks, description, due_date, priority, self.last_task_number)
+                self.set_tasks(all_tasks, added=new_task)
                 if new_task:
                     # Clear input fields
                     for entry in self.entries.values():
@@ -335,7 +624,7 @@ class TaskPlannerGUI:
                 else:
                     messagebox.showerror("Error", "Invalid task parameters!")
             else:
-                messagebox.showerror("Error", TaskManager.validate_task(priority, due_date)[1])
+                messagebox.showerror("Error", message)
         
         except ValueError as e:
             messagebox.showerror("Error", str(e))
@@ -343,10 +632,9 @@ class TaskPlannerGUI:
     def delete_task_handler(self):
         selected = self.task_listbox.curselection()
         if selected:
-            task_id = self.tasks[selected[0]].task_id
-            self.tasks = TaskManager.delete_task(self.tasks, task_id)
-            TaskManager.save_tasks(self.tasks)
-            TaskManager.renumber_tasks(self.tasks, custom_replace)
+            removed_task = self.tasks[selected[0]]
+            all_tasks = TaskManager.delete_task(self.all_tasks, removed_task.task_id, self.task_index)
+            self.set_tasks(all_tasks, removed=removed_task)
             self.refresh_task_list()
 
     def update_task_handler(self):
@@ -363,7 +651,7 @@ class TaskPlannerGUI:
         update_entries = {}
         update_fields = [
             ("Update Description", "description", str),
-            ("Update Due Date (YYYY-MM-DD)", "due_date", lambda x: datetime.strptime(x, "%Y-%m-%d")),
+            ("Update Due Date (YYYY-MM-DD)", "due_date", parse_entry_date),
             ("Update Priority", "priority", int)
         ]
 
@@ -397,8 +685,8 @@ class TaskPlannerGUI:
                 messagebox.showerror("Error", "No updates provided!")
                 return
 
-            self.tasks, _ = TaskManager.update_task(self.tasks, task_id, updates, custom_replace)
-            TaskManager.save_tasks(self.tasks)
+            all_tasks, _ = TaskManager.update_task(self.all_tasks, task_id, updates, custom_replace, self.task_index)
+            self.set_tasks(all_tasks)
             self.refresh_task_list()
             update_window.destroy()
 
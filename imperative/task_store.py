@@ -0,0 +1,232 @@
+import os
+import re
+import json
+from dataclasses import dataclass, replace
+from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the json module
+    orjson = None
+
+# Shares the functional version's tasks file unless the TASKS_FILE environment variable points elsewhere
+TASKS_FILE = os.environ.get("TASKS_FILE") or str(Path(__file__).resolve().parent.parent / "functional_programming" / "tasks.json")
+
+# The functional version keeps tasks in SQLite for these suffixes, this version only reads JSON
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+STATUSES = ("Pending", "Completed", "Overdue")
+
+# Sort keys built once and shared by every sort. Stored dates are zero-padded
+# "YYYY-MM-DD HH:MM:SS", so text order is date order.
+SORT_KEYS = {
+    "Priority": attrgetter("priority"),
+    "Due Date": attrgetter("due_date")
+}
+
+# Last tasks read from or written to TASKS_FILE, reused while the file's mtime is unchanged
+task_cache = {"path": None, "mtime": None, "tasks": [], "data": None}
+
+@dataclass(slots=True)
+class Task:
+    # Slots instead of a dict per task; the GUI edits the fields in place
+    task_id: str
+    description: str
+    due_date: str  # Stored "YYYY-MM-DD HH:MM:SS" text
+    priority: int
+    status: str = "Pending"
+
+def task_from_dict(task_dict):
+    return Task(
+        task_id=task_dict["task_id"],
+        description=task_dict["description"],
+        due_date=task_dict["due_date"],
+        priority=task_dict["priority"],
+        status=task_dict["status"]
+    )
+
+def task_to_dict(task):
+    # Only used by the json fallback, orjson writes dataclasses itself
+    return {
+        "task_id": task.task_id,
+        "description": task.description,
+        "due_date": task.due_date,
+        "priority": task.priority,
+        "status": task.status
+    }
+
+def copy_tasks(tasks):
+    # Tasks are edited in place, so anything kept past the call gets its own copies
+    return [replace(task) for task in tasks]
+
+def parse_due_date(value):
+    # fromisoformat handles the stored "YYYY-MM-DD HH:MM:SS" layout much faster than strptime
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+def format_due_date(due_date):
+    return due_date.isoformat(sep=" ", timespec="seconds")
+
+def parse_entry_date(value):
+    # The date boxes only accept YYYY-MM-DD, so split it instead of going through strptime.
+    # int() would also take spaces, signs and short fields, so check the layout first.
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value, re.ASCII):
+        year, month, day = value.split("-")
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    raise ValueError(f"time data {value!r} does not match format 'YYYY-MM-DD'")
+
+def check_tasks_file():
+    # Refuse a SQLite file instead of reading it as empty JSON and replacing it on the next save
+    if TASKS_FILE.endswith(SQLITE_SUFFIXES):
+        raise ValueError(f"TASKS_FILE {TASKS_FILE!r} is a SQLite database, the imperative version only reads JSON task files")
+
+def load_tasks():
+    check_tasks_file()
+    try:
+        if not os.path.exists(TASKS_FILE):
+            return []
+
+        mtime = os.stat(TASKS_FILE).st_mtime_ns
+        if task_cache["path"] == TASKS_FILE and task_cache["mtime"] == mtime:
+            # Callers edit the tasks in place, so hand out copies
+            return copy_tasks(task_cache["tasks"])
+
+        with open(TASKS_FILE, 'rb') as f:
+            data = f.read()
+        task_dicts = orjson.loads(data) if orjson else json.loads(data)
+        tasks = [task_from_dict(task_dict) for task_dict in task_dicts]
+        remember_tasks(tasks, mtime, data)
+        return copy_tasks(tasks)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return []
+
+def save_tasks(tasks):
+    check_tasks_file()
+    if orjson:
+        data = orjson.dumps(tasks, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(tasks, default=task_to_dict, indent=2).encode()
+
+    # Nothing to write if the file still holds exactly these bytes
+    if (task_cache["path"] == TASKS_FILE and task_cache["data"] == data
+            and os.path.exists(TASKS_FILE) and task_cache["mtime"] == os.stat(TASKS_FILE).st_mtime_ns):
+        return
+
+    # Write to a temporary file and swap it in, so a crash never leaves a truncated file
+    temp_file = TASKS_FILE + ".tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, TASKS_FILE)
+
+    # What we just wrote is the file's content, so the next load can reuse it
+    remember_tasks(copy_tasks(tasks), os.stat(TASKS_FILE).st_mtime_ns, data)
+
+def remember_tasks(tasks, mtime, data):
+    task_cache.update(path=TASKS_FILE, mtime=mtime, tasks=tasks, data=data)
+
+def add_task(tasks, description, due_date, priority, task_number=None):
+    # Validate the parameters before building the task
+    if not validate_task(priority, due_date):
+        return None
+
+    # Callers that track the counter pass the number, otherwise continue after the highest id
+    if task_number is None:
+        task_number = last_task_number(tasks) + 1
+
+    # Create new task
+    new_task = Task(
+        task_id=f"T{task_number}",
+        description=description,
+        due_date=format_due_date(due_date),
+        priority=priority
+    )
+    # Add to the in-memory list, the caller decides when to save
+    tasks.append(new_task)
+    return new_task
+
+def last_task_number(tasks):
+    # Ids are never reused, so new ones continue after the highest existing number.
+    # Ids edited by hand into another shape cannot clash with generated ones, so they are skipped.
+    matches = (re.fullmatch(r"T(\d+)", str(task.task_id), re.ASCII) for task in tasks)
+    return max((int(match[1]) for match in matches if match), default=0)
+
+def index_tasks(tasks):
+    # Map each task_id to its position for constant-time lookups
+    return {task.task_id: i for i, task in enumerate(tasks)}
+
+def find_task(tasks, task_id, task_index=None):
+    # Use the id index when given, otherwise scan for the task
+    if task_index is not None:
+        i = task_index.get(task_id)
+        return tasks[i] if i is not None else None
+
+    for task in tasks:
+        if task.task_id == task_id:
+            return task
+    return None
+
+def update_task(tasks, task_id, updates, task_index=None):
+    # Find and update the task
+    task = find_task(tasks, task_id, task_index)
+    if task is None:
+        return None
+
+    # Update task fields
+    for key, value in updates.items():
+        if key == 'due_date':
+            # Convert datetime to string if needed
+            value = format_due_date(value) if isinstance(value, datetime) else value
+        setattr(task, key, value)
+
+    return task
+
+def delete_task(tasks, task_id, task_index=None):
+    # Remove the task
+    if task_index is not None and task_id in task_index:
+        i = task_index[task_id]
+        tasks = tasks[:i] + tasks[i + 1:]
+    else:
+        tasks = [task for task in tasks if task.task_id != task_id]
+    
+    # Remaining tasks keep their ids, new ones continue after the highest
+    return tasks
+
+def group_by_status(tasks):
+    # One pass splits the tasks by status, keeping their order within each group
+    groups = {status: [] for status in STATUSES}
+    for task in tasks:
+        groups.setdefault(task.status, []).append(task)
+    return groups
+
+def sort_tasks(tasks, sort_by):
+    key = SORT_KEYS.get(sort_by)
+    if key:
+        return sorted(tasks, key=key)
+    return tasks
+
+def validate_task(priority, due_date, now=None):
+    # Batch callers can pass one shared "now" instead of reading the clock per task
+    now = now or datetime.now()
+
+    # Accept stored "YYYY-MM-DD HH:MM:SS" strings as well as datetimes
+    if isinstance(due_date, str):
+        due_date = parse_due_date(due_date)
+    
+    # Validate priority
+    if priority < 1 or priority > 10:
+        return False
+    
+    # Validate due date
+    if due_date <= now:
+        return False
+    
+    return True
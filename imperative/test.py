@@ -1,121 +1,37 @@
-import os
-import json
-from datetime import datetime
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 import tkinter.messagebox as messagebox
 
-TASKS_FILE = "D:/year 4 term 1/concept/project/functional_programming/tasks.json"
-
-def load_tasks():
-    try:
-        if not os.path.exists(TASKS_FILE):
-            return []
-        with open(TASKS_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
-
-def save_tasks(tasks):
-    with open(TASKS_FILE, 'w') as f:
-        json.dump(tasks, f, indent=2)
-
-def add_task(description, due_date, priority):
-    # Load existing tasks
-    tasks = load_tasks()
-    
-    # Create new task
-    new_task = {
-        "task_id": f"T{len(tasks) + 1}",
-        "description": description,
-        "due_date": due_date.strftime("%Y-%m-%d %H:%M:%S"),
-        "priority": priority,
-        "status": "Pending"
-    }
-    # Validate task
-    if validate_task(new_task):
-        # Directly modify the JSON file
-        tasks.append(new_task)
-        save_tasks(tasks)
-        return new_task
-    return None
-
-def update_task(task_id, updates):
-    # Load existing tasks
-    tasks = load_tasks()
-    
-    # Find and update the task
-    for task in tasks:
-        if task['task_id'] == task_id:
-            # Update task fields
-            for key, value in updates.items():
-                if key == 'due_date':
-                    # Convert datetime to string if needed
-                    task[key] = value.strftime("%Y-%m-%d %H:%M:%S") if isinstance(value, datetime) else value
-                else:
-                    task[key] = value
-            
-            # Directly save changes to JSON
-            save_tasks(tasks)
-            return task
-    
-    return None
-
-def delete_task(task_id):
-    # Load existing tasks
-    tasks = load_tasks()
-    
-    # Remove the task
-    tasks = [task for task in tasks if task['task_id'] != task_id]
-    
-    # Renumber tasks
-    for i, task in enumerate(tasks, 1):
-        task['task_id'] = f"T{i}"
-    
-    # Directly save changes to JSON
-    save_tasks(tasks)
-    
-    return tasks
-
-def filter_tasks(filter_by):
-    tasks = load_tasks()
-    
-    if filter_by == "Pending":
-        return [task for task in tasks if task["status"] == "Pending"]
-    elif filter_by == "Completed":
-        return [task for task in tasks if task["status"] == "Completed"]
-    elif filter_by == "Overdue":
-        return [task for task in tasks if task["status"] == "Overdue"]
-    return tasks
-
-def sort_tasks(sort_by):
-    tasks = load_tasks()
-    
-    if sort_by == "Priority":
-        return sorted(tasks, key=lambda task: task["priority"])
-    elif sort_by == "Due Date":
-        return sorted(tasks, key=lambda task: datetime.strptime(task["due_date"], "%Y-%m-%d %H:%M:%S"))
-    return tasks
-
-def validate_task(task):
-    # Convert due_date to datetime if it's a string
-    if isinstance(task["due_date"], str):
-        task["due_date"] = datetime.strptime(task["due_date"], "%Y-%m-%d %H:%M:%S")
-    
-    # Validate priority
-    if task["priority"] < 1 or task["priority"] > 10:
-        return False
-    
-    # Validate due date
-    if task["due_date"] <= datetime.now():
-        return False
-    
-    return True
+# Task loading, saving and editing live in task_store, so the GUI only handles the window
+if __package__:
+    from . import task_store
+else:  # Run as a script, with imperative/ itself on sys.path
+    import task_store
 
 
 class TaskPlannerGUI:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Task Planner")
+
+        # Tasks are kept in memory and written back in batches
+        self.tasks = task_store.load_tasks()
+        self.task_index = task_store.index_tasks(self.tasks)
+        # Counter for new task ids, so adding doesn't rescan every existing id
+        self.last_task_number = task_store.last_task_number(self.tasks)
+        # Tasks grouped by status and kept up to date on every edit, so a filter is a dict lookup
+        self.by_status = task_store.group_by_status(self.tasks)
+        # Sorted copies of the tasks, kept in order on add and delete so re-sorting is free
+        self.sorted_views = {}
+        self.unsaved_changes = False
+        self.save_scheduled = False
+        # A single worker thread does the file writes, in the order they were made
+        self.save_executor = ThreadPoolExecutor(max_workers=1)
+        self.save_future = None
+        # Pending dropdown callbacks, so only the last pick in a quick burst is applied
+        self.pending_choices = {}
+        self.root.protocol("WM_DELETE_WINDOW", self.close_handler)
         
         # Setup UI components
         self.setup_ui()
@@ -174,7 +90,7 @@ class TaskPlannerGUI:
             self.root,
             sort_var,
             *sort_options,
-            command=lambda selection: self.apply_sort(selection)
+            command=lambda selection: self.debounce_choice(self.apply_sort, selection)
         )
         sort_dropdown.grid(row=6, column=1, padx=10, pady=10)
 
@@ -185,16 +101,28 @@ class TaskPlannerGUI:
             self.root,
             filter_var,
             *filter_options,
-            command=lambda selection: self.apply_filter(selection)
+            command=lambda selection: self.debounce_choice(self.apply_filter, selection)
         )
         filter_dropdown.grid(row=7, column=1, padx=10, pady=10)
 
+    def debounce_choice(self, apply, selection):
+        """Apply a dropdown choice once the user has stopped changing it for 100 ms."""
+        pending = self.pending_choices.pop(apply, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self.pending_choices[apply] = self.root.after(100, self.run_choice, apply, selection)
+
+    def run_choice(self, apply, selection):
+        """Run a debounced dropdown choice."""
+        del self.pending_choices[apply]
+        apply(selection)
+
     def apply_sort(self, sort_by: str):
         """Apply sorting to tasks based on user selection."""
         if sort_by == "All":  # Default or no sorting
             self.refresh_task_list()
         else:
-            tasks = sort_tasks(sort_by)
+            tasks = list(self.sorted_view(sort_by))
             self.update_task_listbox(tasks)
 
     def apply_filter(self, filter_by: str):
@@ -202,31 +130,123 @@ class TaskPlannerGUI:
         if filter_by == "All":  # Default or no filtering
             self.refresh_task_list()
         else:
-            tasks = filter_tasks(filter_by)
+            tasks = list(self.by_status.get(filter_by, self.tasks))
             self.update_task_listbox(tasks)
 
+    def sorted_view(self, sort_by):
+        """Return the tasks sorted by sort_by, sorting only when no kept copy exists."""
+        if sort_by not in task_store.SORT_KEYS:
+            return self.tasks
+
+        if sort_by not in self.sorted_views:
+            self.sorted_views[sort_by] = task_store.sort_tasks(self.tasks, sort_by)
+        return self.sorted_views[sort_by]
+
+    def update_sorted_views(self, added=None, removed=None):
+        """Keep the sorted copies in order after a single add or delete."""
+        for sort_by, view in self.sorted_views.items():
+            key = task_store.SORT_KEYS[sort_by]
+            if removed is not None:
+                # Jump to the first task with the same key, then find the exact one
+                index = bisect_left(view, key(removed), key=key)
+                while view[index] is not removed:
+                    index += 1
+                del view[index]
+            if added is not None:
+                # New tasks come last, so they go after equal keys like a stable sort
+                insort(view, added, key=key)
+
     def update_task_listbox(self, tasks):
         """Update task listbox with given tasks."""
-        self.task_listbox.delete(0, tk.END)
+        # Remember what is shown so a selected row maps back to its task
+        self.visible_tasks = tasks
+        rows = []
         for task in tasks:
-            self.task_listbox.insert(
-                tk.END, 
-                f"{task['task_id']} - {task['description']} (Due: {task['due_date']}, Priority: {task['priority']}, Status: {task['status']})"
-            )
+            rows.append(f"{task.task_id} - {task.description} (Due: {task.due_date}, Priority: {task.priority}, Status: {task.status})")
+
+        # Insert every row with a single Tcl call
+        self.task_listbox.delete(0, tk.END)
+        self.task_listbox.insert(tk.END, *rows)
+
+    def add_to_status_group(self, task):
+        """Insert a task into its status group at its position in the task list."""
+        group = self.by_status.setdefault(task.status, [])
+        position = bisect_left(group, self.task_index[task.task_id], key=lambda t: self.task_index[t.task_id])
+        group.insert(position, task)
 
     def refresh_task_list(self):
-        """Refresh task list from JSON file."""
-        tasks = load_tasks()
-        self.update_task_listbox(tasks)
+        """Refresh task list from the in-memory tasks."""
+        self.update_task_listbox(self.tasks)
+
+    def schedule_save(self):
+        """Mark tasks as changed and write them once the burst of edits settles."""
+        self.unsaved_changes = True
+        if not self.save_scheduled:
+            self.save_scheduled = True
+            self.root.after(500, self.save_if_dirty)
+
+    def save_if_dirty(self):
+        """Write pending changes to the JSON file on the background thread."""
+        self.save_scheduled = False
+        if not self.unsaved_changes:
+            return
+
+        if self.save_future is not None and not self.save_future.done():
+            # The worker is still busy, check back shortly
+            self.save_scheduled = True
+            self.root.after(100, self.save_if_dirty)
+            return
+
+        # Handlers edit the tasks in place, so the worker gets its own copies
+        future = self.save_executor.submit(task_store.save_tasks, task_store.copy_tasks(self.tasks))
+        self.save_future = future
+        self.unsaved_changes = False
+        self.root.after(100, self.check_save, future)
+
+    def check_save(self, future):
+        """Report a failed background write once it finishes."""
+        if not future.done():
+            self.root.after(100, self.check_save, future)
+            return
+
+        error = future.exception()
+        if error:
+            # Mark the tasks unsaved again so they are written next time
+            self.unsaved_changes = True
+            messagebox.showerror("Error", f"Could not save tasks: {error}")
+
+    def close_handler(self):
+        """Save before closing, and keep the window open if the save fails."""
+        # A failed earlier write that was not polled yet still needs saving
+        if self.save_future is not None and self.save_future.exception() is not None:
+            self.unsaved_changes = True
+
+        if self.unsaved_changes:
+            self.save_future = self.save_executor.submit(task_store.save_tasks, task_store.copy_tasks(self.tasks))
+            error = self.save_future.exception()
+            if error:
+                # Closing now would lose the edits
+                messagebox.showerror("Error", f"Could not save tasks: {error}")
+                return
+            self.unsaved_changes = False
+
+        self.save_executor.shutdown(wait=True)
+        self.root.destroy()
 
     def add_task_handler(self):
         try:
             description = self.entries['description'].get()
-            due_date = datetime.strptime(self.entries['due_date'].get(), "%Y-%m-%d")
+            due_date = task_store.parse_entry_date(self.entries['due_date'].get())
             priority = int(self.entries['priority'].get())
             
-            new_task = add_task(description, due_date, priority)
+            new_task = task_store.add_task(self.tasks, description, due_date, priority, self.last_task_number + 1)
             if new_task:
+                self.last_task_number += 1
+                self.task_index[new_task.task_id] = len(self.tasks) - 1
+                self.add_to_status_group(new_task)
+                self.update_sorted_views(added=new_task)
+                self.schedule_save()
+
                 # Clear input fields
                 for entry in self.entries.values():
                     entry.delete(0, tk.END)
@@ -242,9 +262,17 @@ class TaskPlannerGUI:
     def delete_task_handler(self):
         selected = self.task_listbox.curselection()
         if selected:
-            tasks = load_tasks()
-            task_id = tasks[selected[0]]['task_id']
-            delete_task(task_id)
+            task_id = self.visible_tasks[selected[0]].task_id
+            position = self.task_index[task_id]
+            removed_task = self.tasks[position]
+            self.by_status[removed_task.status].remove(removed_task)
+            self.update_sorted_views(removed=removed_task)
+            self.tasks = task_store.delete_task(self.tasks, task_id, self.task_index)
+            del self.task_index[task_id]
+            # Only the tasks after the deleted one move
+            for index in range(position, len(self.tasks)):
+                self.task_index[self.tasks[index].task_id] = index
+            self.schedule_save()
             self.refresh_task_list()
 
     def update_task_handler(self):
@@ -253,8 +281,7 @@ class TaskPlannerGUI:
             messagebox.showerror("Error", "No task selected!")
             return
 
-        tasks = load_tasks()
-        task_id = tasks[selected[0]]['task_id']
+        task_id = self.visible_tasks[selected[0]].task_id
         update_window = tk.Toplevel(self.root)
         update_window.title("Update Task")
 
@@ -262,7 +289,7 @@ class TaskPlannerGUI:
         update_entries = {}
         update_fields = [
             ("Update Description", "description", str),
-            ("Update Due Date (YYYY-MM-DD)", "due_date", lambda x: datetime.strptime(x, "%Y-%m-%d")),
+            ("Update Due Date (YYYY-MM-DD)", "due_date", task_store.parse_entry_date),
             ("Update Priority", "priority", int)
         ]
 
@@ -296,7 +323,22 @@ class TaskPlannerGUI:
                 messagebox.showerror("Error", "No updates provided!")
                 return
 
-            update_task(task_id, updates)
+            task = task_store.find_task(self.tasks, task_id, self.task_index)
+            if task is None:
+                # The task was deleted while this window was open
+                update_window.destroy()
+                self.refresh_task_list()
+                return
+
+            old_status = task.status
+            task_store.update_task(self.tasks, task_id, updates, self.task_index)
+            if task.status != old_status:
+                self.by_status[old_status].remove(task)
+                self.add_to_status_group(task)
+            if 'priority' in updates or 'due_date' in updates:
+                # The task's sort keys changed in place, so sort again next time
+                self.sorted_views = {}
+            self.schedule_save()
             self.refresh_task_list()
             update_window.destroy()
 
@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest import mock
+
+from functional_programming.concept_project import Task, TaskManager, TaskPlannerGUI, parse_entry_date, row_edits
+
+
+def make_tasks(count):
+    statuses = TaskManager.STATUSES
+    return [
+        Task(f"T{number}", "task", datetime(2030, 1, 1) + timedelta(hours=number * 7 % 500), number % 10 + 1, statuses[number % 3])
+        for number in range(1, count + 1)
+    ]
+
+
+def make_gui(tasks):
+    # The view and edit logic without a window, so the tests run without a display
+    gui = TaskPlannerGUI.__new__(TaskPlannerGUI)
+    gui.root = mock.Mock()
+    gui.all_tasks = tasks
+    gui.task_index = TaskManager.index_tasks(tasks)
+    gui.sort_by = "All"
+    gui.filter_by = "All"
+    gui.sorted_views = {}
+    gui.status_groups = {}
+    gui.unsaved_changes = False
+    gui.save_scheduled = False
+    return gui
+
+
+class TaskNumberTest(unittest.TestCase):
+    def test_last_task_number_skips_other_ids(self):
+        tasks = [replace(task, task_id=task_id) for task, task_id in zip(make_tasks(5), ["T3", "X9", "T", "T1a", "T12"])]
+        self.assertEqual(TaskManager.last_task_number(tasks), 12)
+        self.assertEqual(TaskManager.last_task_number(tasks[1:3]), 0)
+        self.assertEqual(TaskManager.last_task_number([]), 0)
+
+
+class ParseTest(unittest.TestCase):
+    def test_entry_date_layout(self):
+        self.assertEqual(parse_entry_date("2025-01-02"), datetime(2025, 1, 2))
+        for value in (" 2025-01-02", "2025-01-02 ", "+2025-1-2", "2025-1-2", "2025-13-01", "2025-02-30", "٢٠٢٥-٠١-٠٢", ""):
+            with self.subTest(value=value), self.assertRaisesRegex(ValueError, "YYYY-MM-DD"):
+                parse_entry_date(value)
+
+
+class RowEditsTest(unittest.TestCase):
+    def apply(self, old_rows, new_rows):
+        # Replay the edits on a list the way the Listbox would, with inclusive delete ranges
+        rows = list(old_rows)
+        edits = row_edits(old_rows, new_rows)
+        for operation, index, argument in edits:
+            if operation == "delete":
+                del rows[index:argument + 1]
+            else:
+                rows[index:index] = argument
+        self.assertEqual(rows, new_rows)
+        return edits
+
+    def test_unchanged_rows_need_no_edits(self):
+        self.assertEqual(self.apply(["a", "b"], ["a", "b"]), [])
+
+    def test_insert(self):
+        self.assertEqual(self.apply(["a", "c"], ["a", "b", "c"]), [("insert", 1, ["b"])])
+        self.assertEqual(self.apply([], ["a", "b"]), [("insert", 0, ["a", "b"])])
+
+    def test_delete(self):
+        self.assertEqual(self.apply(["a", "b", "c"], ["a", "c"]), [("delete", 1, 1)])
+        self.assertEqual(self.apply(["a", "b"], []), [("delete", 0, 1)])
+
+    def test_replace_in_the_middle(self):
+        self.assertEqual(
+            self.apply(["a", "b", "c", "d"], ["a", "x", "y", "z", "d"]),
+            [("delete", 1, 2), ("insert", 1, ["x", "y", "z"])]
+        )
+
+    def test_repeated_rows(self):
+        self.apply(["a", "a", "a"], ["a", "a"])
+        self.apply(["a", "b", "a"], ["a", "a", "b", "a"])
+
+
+class SqliteSaveTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "tasks.db")
+        for patcher in (
+            mock.patch.object(TaskManager, "TASKS_FILE", self.path),
+            mock.patch.dict(TaskManager.task_cache, {"path": None, "version": None, "tasks": []}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.tasks = make_tasks(4)
+        TaskManager.save_tasks(self.tasks)
+        # Log every row a save inserts or updates, so the tests can tell a diff from a full rewrite
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            conn.executescript(
+                "CREATE TABLE writes (task_id TEXT);"
+                "CREATE TRIGGER log_insert AFTER INSERT ON tasks BEGIN INSERT INTO writes VALUES (NEW.task_id); END;"
+                "CREATE TRIGGER log_update AFTER UPDATE ON tasks BEGIN INSERT INTO writes VALUES (NEW.task_id); END;"
+            )
+        TaskManager.remember_tasks(list(self.tasks), TaskManager.file_version())
+
+    def written_ids(self):
+        with closing(sqlite3.connect(self.path)) as conn:
+            return [row[0] for row in conn.execute("SELECT task_id FROM writes")]
+
+    def reload(self):
+        TaskManager.task_cache.update(path=None, version=None, tasks=[])
+        return TaskManager.load_tasks()
+
+    def test_edit_writes_only_changed_rows(self):
+        tasks = TaskManager.delete_task(self.tasks, "T2")
+        tasks, _ = TaskManager.update_task(tasks, "T3", {"description": "changed"}, replace)
+        tasks, _ = TaskManager.add_task(tasks, "new", datetime(2031, 1, 1), 3)
+
+        TaskManager.save_tasks(tasks)
+
+        self.assertEqual(self.written_ids(), ["T3", "T5"])
+        self.assertEqual(self.reload(), tasks)
+
+    def test_reorder_rewrites_all_rows(self):
+        tasks = [self.tasks[2], self.tasks[0], self.tasks[3], self.tasks[1]]
+
+        TaskManager.save_tasks(tasks)
+
+        self.assertEqual(sorted(self.written_ids()), ["T1", "T2", "T3", "T4"])
+        self.assertEqual(self.reload(), tasks)
+
+    def test_wal_commit_from_another_connection_invalidates_cache(self):
+        # Keeping the connection open leaves the commit in the -wal file, the main file's mtime does not change
+        with closing(sqlite3.connect(self.path)) as conn:
+            with conn:
+                conn.execute("UPDATE tasks SET description = 'external' WHERE task_id = 'T2'")
+
+            tasks = TaskManager.load_tasks()
+            self.assertEqual(tasks[1].description, "external")
+
+            tasks, _ = TaskManager.update_task(tasks, "T1", {"priority": 9}, replace)
+            TaskManager.save_tasks(tasks)
+
+        self.assertEqual(self.reload(), tasks)
+
+
+class ViewTest(unittest.TestCase):
+    def setUp(self):
+        self.gui = make_gui(make_tasks(50))
+
+    def expected_view(self, tasks):
+        return [task for task in sorted(tasks, key=lambda task: task.priority) if task.status == "Pending"]
+
+    def test_add_and_delete_keep_sorted_views_in_order(self):
+        self.gui.sort_by = "Priority"
+        self.gui.filter_by = "Pending"
+        self.gui.tasks = self.gui.current_view()
+
+        tasks, added = TaskManager.add_task(self.gui.all_tasks, "new", datetime(2031, 1, 1), 5)
+        self.gui.set_tasks(tasks, added=added)
+        removed = tasks[10]
+        self.gui.set_tasks(TaskManager.delete_task(tasks, removed.task_id, self.gui.task_index), removed=removed)
+
+        self.assertIn("Priority", self.gui.sorted_views)
+        self.assertEqual(self.gui.tasks, self.expected_view(self.gui.all_tasks))
+
+    def test_update_sorts_again(self):
+        self.gui.sort_by = "Priority"
+        self.gui.filter_by = "Pending"
+        self.gui.tasks = self.gui.current_view()
+
+        tasks, _ = TaskManager.update_task(self.gui.all_tasks, "T3", {"priority": 1}, replace, self.gui.task_index)
+        self.gui.set_tasks(tasks)
+
+        self.assertEqual(self.gui.tasks, self.expected_view(tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from imperative import task_store
+
+
+class TaskStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.use_tasks_file("tasks.json")
+
+    def use_tasks_file(self, name):
+        path = os.path.join(self.directory.name, name)
+        patcher = mock.patch.object(task_store, "TASKS_FILE", path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache = mock.patch.dict(task_store.task_cache, {"path": None, "mtime": None, "tasks": [], "data": None})
+        cache.start()
+        self.addCleanup(cache.stop)
+        return path
+
+
+class TaskNumberTest(unittest.TestCase):
+    def test_last_task_number_skips_other_ids(self):
+        tasks = [task_store.Task(task_id, "task", "2030-01-01 00:00:00", 1) for task_id in ["T3", "X9", "T", "T1a", "T12", 7]]
+        self.assertEqual(task_store.last_task_number(tasks), 12)
+        self.assertEqual(task_store.last_task_number(tasks[1:4]), 0)
+        self.assertEqual(task_store.last_task_number([]), 0)
+
+
+class ParseTest(unittest.TestCase):
+    def test_entry_date_layout(self):
+        self.assertEqual(task_store.parse_entry_date("2025-01-02"), datetime(2025, 1, 2))
+        for value in (" 2025-01-02", "2025-01-02 ", "+2025-1-2", "2025-1-2", "2025-13-01", "2025-02-30", "٢٠٢٥-٠١-٠٢", ""):
+            with self.subTest(value=value), self.assertRaisesRegex(ValueError, "YYYY-MM-DD"):
+                task_store.parse_entry_date(value)
+
+
+class SaveLoadTest(TaskStoreTestCase):
+    def test_round_trip_keeps_the_json_layout(self):
+        tasks = []
+        task_store.add_task(tasks, "first", datetime(2030, 1, 2, 3, 4, 5), 4)
+        task_store.add_task(tasks, "second", datetime(2031, 1, 1), 7)
+        task_store.update_task(tasks, "T2", {"status": "Completed"})
+
+        task_store.save_tasks(tasks)
+        with open(task_store.TASKS_FILE, "rb") as f:
+            self.assertIn(b'"due_date": "2030-01-02 03:04:05"', f.read())
+
+        task_store.task_cache.update(path=None, mtime=None, tasks=[], data=None)
+        self.assertEqual(task_store.load_tasks(), tasks)
+
+    def test_loaded_tasks_are_copies(self):
+        tasks = []
+        task_store.add_task(tasks, "first", datetime(2030, 1, 1), 4)
+        task_store.save_tasks(tasks)
+
+        loaded = task_store.load_tasks()
+        loaded[0].priority = 9
+        self.assertEqual(task_store.load_tasks()[0].priority, 4)
+
+    def test_unknown_field_is_rejected(self):
+        tasks = []
+        task_store.add_task(tasks, "first", datetime(2030, 1, 1), 4)
+        with self.assertRaises(AttributeError):
+            task_store.update_task(tasks, "T1", {"colour": "red"})
+
+
+class SqliteFileTest(TaskStoreTestCase):
+    def test_sqlite_file_is_refused_and_left_alone(self):
+        path = self.use_tasks_file("tasks.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE tasks (task_id TEXT)")
+            conn.execute("INSERT INTO tasks VALUES ('T1')")
+        conn.close()
+
+        with self.assertRaisesRegex(ValueError, "SQLite"):
+            task_store.load_tasks()
+        with self.assertRaisesRegex(ValueError, "SQLite"):
+            task_store.save_tasks([])
+
+        with sqlite3.connect(path) as conn:
+            self.assertEqual(conn.execute("SELECT task_id FROM tasks").fetchall(), [("T1",)])
+        conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()